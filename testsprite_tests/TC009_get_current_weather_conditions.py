@@ -1,24 +1,18 @@
+import pytest
 import requests
+from _http import BASE_URL, LOCATION, TIMEOUT
 
-BASE_URL = "http://localhost:5173"
-TIMEOUT = 30
-
-def test_get_current_weather_conditions():
-    # Example coordinates for testing (latitude and longitude)
-    lat = 34.0522   # Los Angeles latitude
-    lng = -118.2437 # Los Angeles longitude
+pytestmark = pytest.mark.integration
 
+@pytest.mark.parametrize("lat,lng", [LOCATION])
+def test_get_current_weather_conditions(http, lat, lng):
     url = f"{BASE_URL}/api/weather/current"
-    params = {"lat": lat, "lng": lng}
-    headers = {
-        "Accept": "application/json"
-    }
 
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=TIMEOUT)
+        response = http.get(url, params={"lat": lat, "lng": lng}, timeout=TIMEOUT)
         response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        assert False, f"Request to get current weather conditions failed: {e}"
+    except requests.RequestException as e:
+        pytest.fail(f"Request to get current weather conditions failed: {e}")
 
     # Validate response status code
     assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
@@ -69,12 +63,10 @@ def test_get_current_weather_conditions():
     # Additional validation: simulate offline scenario by checking for proper error handling
     # Since we cannot simulate offline in this test, we check that server returns error for missing params
     try:
-        bad_response = requests.get(url, headers=headers, timeout=TIMEOUT)
+        bad_response = http.get(url, timeout=TIMEOUT)
         # We expect a 4xx error due to missing required parameters
         assert bad_response.status_code >= 400 and bad_response.status_code < 500, \
             "Expected client error status code for missing parameters"
     except requests.exceptions.RequestException:
         # If request fails due to connection error, consider offline scenario handled by client
         pass
-
-test_get_current_weather_conditions()
\ No newline at end of file
@@ -1,24 +1,49 @@
+import pytest
 import requests
+import responses
+from _http import BASE_URL, LOCATION, TIMEOUT
 
-BASE_URL = "http://localhost:5173"
-TIMEOUT = 30
+# Expected keys in each alert (based on typical emergency alert structure)
+_ALERT_KEYS = frozenset({"id", "title", "description", "severity", "startTime", "endTime", "location", "type"})
 
-def test_get_current_alerts_for_location():
-    # Example coordinates for a location in California
-    lat = 34.052235
-    lng = -118.243683
+# Canned alerts for LOCATION in the envelope the alerts endpoint returns
+ALERTS = {
+    "success": True,
+    "alerts": [
+        {
+            "id": "alert-la-red-flag",
+            "title": "Red Flag Warning",
+            "description": "Gusty winds and low humidity create critical fire weather conditions.",
+            "severity": "high",
+            "startTime": "2025-11-20T08:00:00Z",
+            "endTime": "2025-11-21T20:00:00Z",
+            "location": {"lat": 34.052235, "lng": -118.243683},
+            "type": "fire-weather"
+        },
+        {
+            "id": "alert-la-air-quality",
+            "title": "Air Quality Advisory",
+            "description": "Smoke may cause unhealthy air for sensitive groups.",
+            "severity": "medium",
+            "startTime": "2025-11-20T10:00:00Z",
+            "endTime": "2025-11-20T22:00:00Z",
+            "location": {"lat": 34.0537, "lng": -118.2428},
+            "type": "air-quality"
+        }
+    ],
+    "metadata": {"userLocation": {"lat": LOCATION[0], "lng": LOCATION[1]}}
+}
 
+@pytest.mark.parametrize("lat,lng", [LOCATION])
+@responses.activate
+def test_get_current_alerts_for_location(http, lat, lng):
     url = f"{BASE_URL}/api/alerts/current"
-    headers = {
-        "Accept": "application/json"
-    }
-    params = {
-        "lat": lat,
-        "lng": lng
-    }
+    responses.add(responses.GET, url, json=ALERTS, status=200)
+    # An unreachable host, to check that failures surface as RequestException
+    responses.add(responses.GET, "http://invalidhost/api/alerts/current", body=requests.ConnectionError())
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=TIMEOUT)
+        response = http.get(url, params={"lat": lat, "lng": lng}, timeout=TIMEOUT)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         assert False, f"Request failed: {e}"
@@ -29,15 +54,14 @@ def test_get_current_alerts_for_location():
 
     data = response.json()
 
-    # Validate that data is a list (alerts)
-    assert isinstance(data, list), "Response JSON is not a list"
+    assert data.get("success") is True, "Alerts request failed"
+    alerts = data.get("alerts")
+    assert isinstance(alerts, list), "Response 'alerts' is not a list"
 
     # Validate each alert object structure and data types
-    for alert in data:
+    for alert in alerts:
         assert isinstance(alert, dict), "Alert item is not a dictionary"
-        # Check for expected keys in alert (based on typical emergency alert structure)
-        expected_keys = {"id", "title", "description", "severity", "startTime", "endTime", "location", "type"}
-        missing_keys = expected_keys - alert.keys()
+        missing_keys = _ALERT_KEYS - alert.keys()
         assert not missing_keys, f"Alert missing keys: {missing_keys}"
 
         # Validate types of some fields
@@ -51,12 +75,9 @@ def test_get_current_alerts_for_location():
         assert isinstance(alert["type"], str), "Alert type should be string"
 
     # Additional checks for offline functionality and error handling
-    # Simulate offline by sending request to invalid URL and expect failure
-    offline_url = f"http://localhost:5173/api/alerts/current"
+    # Simulate offline with the unreachable host registered above and expect failure
     try:
-        requests.get("http://invalidhost/api/alerts/current", timeout=5)
+        http.get("http://invalidhost/api/alerts/current", timeout=TIMEOUT)
         assert False, "Request to invalid host should fail"
     except requests.exceptions.RequestException:
         pass  # Expected failure
-
-test_get_current_alerts_for_location()
\ No newline at end of file
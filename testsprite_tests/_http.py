@@ -0,0 +1,95 @@
+"""Shared HTTP session and request helpers for the TestSprite backend tests.
+
+A single pooled ``requests.Session`` lets every TC file reuse keep-alive
+connections to the dev server instead of opening a new one per call.
+Importing this module also switches requests' JSON handling to orjson.
+"""
+import atexit
+import json
+
+import orjson
+import requests
+import requests.models
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class _OrjsonShim:
+    """Stands in for the ``json`` module inside ``requests.models``.
+
+    orjson takes the common path; anything it would treat differently from
+    the stdlib (keyword options, non-str keys, NaN/Infinity) goes to ``json``.
+    """
+
+    @staticmethod
+    def loads(s, **kwargs):
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    @staticmethod
+    def dumps(obj, allow_nan=True, **kwargs):
+        if not kwargs:
+            try:
+                body = orjson.dumps(obj)
+            except TypeError:
+                # orjson rejects what json coerces, such as int dict keys
+                pass
+            else:
+                # orjson writes NaN/Infinity as null, so only a body with a
+                # null in it can hide one; json re-encodes just those.
+                if b"null" not in body:
+                    return body
+        return json.dumps(obj, allow_nan=allow_nan, **kwargs)
+
+
+# Every Response.json() (and any json= request body) now tries orjson first.
+requests.models.complexjson = _OrjsonShim
+
+BASE_URL = "http://localhost:5173"
+TIMEOUT = 30
+
+# Downtown Los Angeles; shared by the location-based tests.
+LOCATION = (34.052235, -118.243683)
+
+SESSION = requests.Session()
+SESSION.headers.update({"Accept": "application/json"})
+SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        # Ride out dev-server restarts and proxy hiccups with exponential
+        # backoff; a test only fails once the retry budget is spent.
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST", "PUT"}),
+        ),
+    ),
+)
+
+# Every consumer (the pytest fixtures, run_threaded.py) borrows this one
+# pool, so it is closed once, when the process exits.
+atexit.register(SESSION.close)
+
+# Fields every community report test submits; the tests fill in the rest.
+_REPORT_FIELDS = {
+    "location": {"lat": LOCATION[0], "lng": LOCATION[1]},
+    "hazardType": "fire-spotting",
+}
+_REPORT_TEMPLATE = SESSION.prepare_request(
+    requests.Request(
+        "POST",
+        f"{BASE_URL}/api/community/report",
+        headers={"Content-Type": "application/json"},
+    )
+)
+
+
+def prepare_report(**fields):
+    """Copy the prepared community report POST with ``fields`` in its body."""
+    request = _REPORT_TEMPLATE.copy()
+    request.prepare_body(orjson.dumps({**_REPORT_FIELDS, **fields}), None)
+    return request
@@ -0,0 +1,9 @@
+import pytest
+
+from _http import SESSION
+
+
+@pytest.fixture(scope="session")
+def http():
+    """The pooled session from ``_http``; it is closed at interpreter exit."""
+    return SESSION
@@ -0,0 +1,63 @@
+"""Run the TestSprite integration tests concurrently on a thread pool.
+
+Each test is an independent, I/O-bound round trip against the dev server, so
+every test gets its own worker thread and the waits overlap on the shared
+pooled session from ``_http``. The mocked schema tests (TC001/TC002/TC010)
+are left to pytest: they patch requests process-wide, which would intercept
+the live tests running alongside them.
+"""
+import inspect
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from _http import LOCATION, SESSION
+from TC003_create_new_family_group import test_create_new_family_group
+from TC004_join_family_group_by_code import test_join_family_group_by_code
+from TC005_activate_crisis_mode_for_area import test_activate_crisis_mode_for_area
+from TC008_get_ai_risk_analysis_for_location import test_get_ai_risk_analysis_for_location
+from TC009_get_current_weather_conditions import test_get_current_weather_conditions
+
+TESTS = [
+    test_create_new_family_group,
+    test_join_family_group_by_code,
+    test_activate_crisis_mode_for_area,
+    test_get_ai_risk_analysis_for_location,
+    test_get_current_weather_conditions,
+]
+
+# Stand-ins for the pytest fixtures and parameters the tests ask for.
+ARGS = {
+    "http": SESSION,
+    "lat": LOCATION[0],
+    "lng": LOCATION[1],
+}
+
+
+def run(test):
+    kwargs = {name: ARGS[name] for name in inspect.signature(test).parameters}
+    try:
+        test(**kwargs)
+    except (Exception, pytest.fail.Exception):
+        return test.__name__, traceback.format_exc()
+    return test.__name__, None
+
+
+def main():
+    with ThreadPoolExecutor(max_workers=len(TESTS)) as pool:
+        results = list(pool.map(run, TESTS))
+    failed = 0
+    for name, error in results:
+        if error:
+            failed += 1
+            print(f"FAIL {name}\n{error}")
+        else:
+            print(f"PASS {name}")
+    print(f"{len(results) - failed} passed, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())